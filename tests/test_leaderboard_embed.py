@@ -15,7 +15,7 @@ def make_summary(user_id: str, name: str, average_attempts: float, wins: int, wi
         losses=0,
         win_rate=win_rate,
         average_attempts=average_attempts,
-        guess_distribution={str(i): 0 for i in range(1, 7)},
+        guess_distribution=[0] * 6,
         total_attempts=int(average_attempts * wins),
         last_puzzle=None,
     )
@@ -0,0 +1,56 @@
+from wordler_bot.parser import parse_daily_summary, parse_wordle_message
+
+
+def test_parse_wordle_message_extracts_result_and_board():
+    content = "Wordle 942 4/6*\n\n⬛⬛🟨⬛⬛\n🟩🟩🟩🟩🟩"
+
+    result = parse_wordle_message(content)
+
+    assert result is not None
+    assert result.puzzle_number == 942
+    assert result.success
+    assert result.attempts == 4
+    assert result.hard_mode
+    assert result.board == ["⬛⬛🟨⬛⬛", "🟩🟩🟩🟩🟩"]
+
+
+def test_parse_wordle_message_handles_loss():
+    result = parse_wordle_message("Wordle 942 X/6")
+
+    assert result is not None
+    assert not result.success
+    assert result.attempts is None
+
+
+def test_parse_wordle_message_ignores_chatter():
+    assert parse_wordle_message("good morning everyone") is None
+    assert parse_wordle_message("") is None
+
+
+def test_parse_daily_summary_collects_mentions_and_handles():
+    content = "Your group is on a 5 day streak!\n3/6: <@111> @alice\n5/6: <@!222>\nX/6: @bob"
+
+    entries = parse_daily_summary(content)
+
+    assert [(e.user_id, e.handle, e.success, e.attempts) for e in entries] == [
+        (111, None, True, 3),
+        (None, "alice", True, 3),
+        (222, None, True, 5),
+        (None, "bob", False, None),
+    ]
+
+
+def test_parse_daily_summary_deduplicates_repeated_players():
+    content = "4/6: <@111> <@111> @alice\n5/6: @Alice"
+
+    entries = parse_daily_summary(content)
+
+    assert [(e.user_id, e.handle) for e in entries] == [(111, None), (None, "alice")]
+
+
+def test_parse_daily_summary_ignores_mentions_outside_score_lines():
+    content = "shoutout to <@999>\n2/6: <@111>"
+
+    entries = parse_daily_summary(content)
+
+    assert [e.user_id for e in entries] == [111]
@@ -1,21 +1,20 @@
 import asyncio
+from types import SimpleNamespace
 
 import pytest
 
-from wordler_bot.stats import StatsManager
+from wordler_bot.parser import WordleResult
+from wordler_bot.stats import PlayerRecord, StatsManager
 
 
 def make_player(display_name: str, *, games: int, wins: int, losses: int, total_attempts: int):
-    return {
-        "display_name": display_name,
-        "games_played": games,
-        "wins": wins,
-        "losses": losses,
-        "total_attempts": total_attempts,
-        "guess_distribution": {str(i): 0 for i in range(1, 7)},
-        "last_puzzle": None,
-        "last_result": None,
-    }
+    return PlayerRecord(
+        display_name=display_name,
+        games_played=games,
+        wins=wins,
+        losses=losses,
+        total_attempts=total_attempts,
+    )
 
 
 @pytest.fixture
@@ -70,6 +69,41 @@ def test_leaderboard_breaks_full_ties_with_name(stats_manager):
     assert [entry.display_name for entry in leaderboard] == ["Alpha", "Beta"]
 
 
+def test_record_result_replays_from_wal_after_restart(tmp_path):
+    data_path = tmp_path / "stats.json"
+    manager = StatsManager(data_path)
+    manager.load()
+    user = SimpleNamespace(id=42, display_name="Player")
+    result = WordleResult(puzzle_number=100, success=True, attempts=4, hard_mode=False, board=[])
+
+    assert asyncio.run(manager.record_result(user, result, message_id=1))
+
+    # The hot path only appends to the WAL; a fresh manager must see the result.
+    restarted = StatsManager(data_path)
+    restarted.load()
+    summary = restarted.get_user_summary(42)
+
+    assert summary is not None
+    assert summary.wins == 1
+    assert not asyncio.run(restarted.record_result(user, result, message_id=1))
+
+
+def test_load_upcasts_legacy_distribution_dicts(tmp_path):
+    data_path = tmp_path / "stats.json"
+    data_path.write_text(
+        '{"users": {"42": {"display_name": "Player", "games_played": 1, "wins": 1,'
+        ' "losses": 0, "total_attempts": 3,'
+        ' "guess_distribution": {"1": 0, "2": 0, "3": 1, "4": 0, "5": 0, "6": 0}}}}'
+    )
+    manager = StatsManager(data_path)
+    manager.load()
+
+    summary = manager.get_user_summary(42)
+
+    assert summary is not None
+    assert summary.guess_distribution == [0, 0, 1, 0, 0, 0]
+
+
 def test_leaderboard_snapshot_round_trip(stats_manager):
     snapshot = ["1", "3", "2"]
     asyncio.run(stats_manager.update_leaderboard_snapshot(snapshot))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 
 import discord
@@ -15,18 +16,17 @@ logger = logging.getLogger(__name__)
 
 def format_distribution(summary: UserSummary) -> str:
     parts = []
-    for i in range(1, 7):
-        count = summary.guess_distribution.get(str(i), 0)
+    for i, count in enumerate(summary.guess_distribution, start=1):
         parts.append(f"{i}:{count}")
     return " | ".join(parts)
 
 
-def build_leaderboard_embed(entries: list[UserSummary], previous_ranks: dict[str, int] | None = None) -> discord.Embed:
-    def shorten(name: str, limit: int = 18) -> str:
-        if len(name) <= limit:
-            return name
-        return name[: limit - 3] + "..."
+# Precompiled once so each leaderboard row is a single bound-format call
+# instead of a six-field f-string rebuilt per entry.
+_ROW_FMT = "{}{:>2} {:<18} {:>6} {:>6} {:>6}".format
+
 
+def build_leaderboard_embed(entries: list[UserSummary], previous_ranks: dict[str, int] | None = None) -> discord.Embed:
     header = f"{'#':>2} {'Player':<18} {'Avg':>6} {'Wins':>6} {'Win%':>6}"
     divider = "=" * len(header)
     lines = [header, divider]
@@ -41,9 +41,10 @@ def build_leaderboard_embed(entries: list[UserSummary], previous_ranks: dict[str
                 indicator = "⬆️ "
             elif previous < index:
                 indicator = "⬇️ "
-        lines.append(
-            f"{indicator}{index:>2} {shorten(entry.display_name):<18} {avg:>6} {entry.wins:>6} {win_pct:>6}"
-        )
+        name = entry.display_name
+        if len(name) > 18:
+            name = name[:15] + "..."
+        lines.append(_ROW_FMT(indicator, index, name, avg, entry.wins, win_pct))
         if index == 3 and len(entries) > 3:
             lines.append("-" * len(header))
     table = "\n".join(lines)
@@ -64,12 +65,53 @@ def create_bot(settings: BotSettings, stats_manager: StatsManager) -> commands.B
 
     daily_leaderboard_task: tasks.Loop | None = None
 
+    # Lowercased name -> member, per guild, maintained by gateway events so
+    # handle resolution is an O(1) lookup instead of a member-cache scan.
+    guild_member_index: dict[int, dict[str, discord.Member]] = {}
+
+    def index_member(index: dict[str, discord.Member], member: discord.Member) -> None:
+        for name in (member.display_name, member.name, member.global_name):
+            if name:
+                index.setdefault(name.lower(), member)
+
+    def build_guild_index(guild: discord.Guild) -> dict[str, discord.Member]:
+        index: dict[str, discord.Member] = {}
+        for member in guild.members:
+            index_member(index, member)
+        guild_member_index[guild.id] = index
+        return index
+
     @bot.event
     async def on_ready():
         logger.info("Logged in as %s (id=%s)", bot.user, getattr(bot.user, "id", "n/a"))
+        for guild in bot.guilds:
+            if getattr(guild, "chunked", False):
+                build_guild_index(guild)
         if daily_leaderboard_task and not daily_leaderboard_task.is_running():
             daily_leaderboard_task.start()
 
+    @bot.event
+    async def on_member_join(member: discord.Member):
+        index = guild_member_index.get(member.guild.id)
+        if index is not None:
+            index_member(index, member)
+
+    @bot.event
+    async def on_member_remove(member: discord.Member):
+        if member.guild.id in guild_member_index:
+            build_guild_index(member.guild)
+
+    @bot.event
+    async def on_member_update(before: discord.Member, after: discord.Member):
+        if after.guild.id not in guild_member_index:
+            return
+        if (
+            before.display_name != after.display_name
+            or before.name != after.name
+            or before.global_name != after.global_name
+        ):
+            build_guild_index(after.guild)
+
     async def process_daily_summary(message: discord.Message) -> tuple[bool, int, int]:
         entries: list[DailySummaryEntry] = parse_daily_summary(message.content)
         if not entries:
@@ -77,6 +119,56 @@ def create_bot(settings: BotSettings, stats_manager: StatsManager) -> commands.B
 
         mention_map = {member.id: member for member in message.mentions}
 
+        name_index: dict[str, discord.Member] = {}
+        if message.guild is not None and any(entry.handle for entry in entries):
+            index = guild_member_index.get(message.guild.id)
+            if index is None and getattr(message.guild, "chunked", False):
+                index = build_guild_index(message.guild)
+            name_index = index or {}
+
+        # Gateway queries are ~100 ms each; fetch every missing mention in a
+        # single user_ids query and run the handle queries concurrently
+        # instead of one round-trip per entry.
+        handle_results: dict[str, list[discord.Member]] = {}
+        if message.guild is not None and hasattr(message.guild, "query_members"):
+            needed_ids = [
+                entry.user_id
+                for entry in entries
+                if entry.user_id is not None
+                and entry.user_id not in mention_map
+                and message.guild.get_member(entry.user_id) is None
+            ]
+            if needed_ids:
+                try:
+                    fetched = await message.guild.query_members(user_ids=needed_ids[:100], limit=100)
+                except discord.DiscordException as exc:
+                    logger.debug("Failed to batch-fetch members for summary %s: %s", message.id, exc)
+                else:
+                    mention_map.update({member.id: member for member in fetched})
+
+            pending_handles: list[str] = []
+            for entry in entries:
+                if entry.user_id is not None:
+                    continue
+                handle = (entry.handle or "").lstrip("@").strip()
+                lower_handle = handle.lower()
+                if not handle or lower_handle in handle_results:
+                    continue
+                if name_index.get(lower_handle) or message.guild.get_member_named(handle):
+                    continue
+                handle_results[lower_handle] = []
+                pending_handles.append(handle)
+            if pending_handles:
+                results = await asyncio.gather(
+                    *(message.guild.query_members(query=handle, limit=5) for handle in pending_handles),
+                    return_exceptions=True,
+                )
+                for handle, result in zip(pending_handles, results):
+                    if isinstance(result, BaseException):
+                        logger.debug("Failed to query members for handle %s: %s", handle, result)
+                    else:
+                        handle_results[handle.lower()] = list(result)
+
         async def resolve_member(entry: DailySummaryEntry) -> discord.Member | discord.User | None:
             member = None
             if entry.user_id is not None:
@@ -110,25 +202,16 @@ def create_bot(settings: BotSettings, stats_manager: StatsManager) -> commands.B
                         return True
                 return False
 
-            if getattr(message.guild, "chunked", False):
-                member = discord.utils.find(_matches, message.guild.members)
-                if member:
-                    return member
-
-            if hasattr(message.guild, "query_members"):
-                try:
-                    results = await message.guild.query_members(query=handle, limit=5)
-                except discord.DiscordException as exc:
-                    logger.debug("Failed to query members for handle %s: %s", handle, exc)
-                    return None
-
-                for candidate in results:
-                    if _matches(candidate):
-                        return candidate
+            member = name_index.get(lower_handle)
+            if member:
+                return member
 
-                return results[0] if results else None
+            results = handle_results.get(lower_handle, [])
+            for candidate in results:
+                if _matches(candidate):
+                    return candidate
 
-            return None
+            return results[0] if results else None
 
         recorded = 0
         skipped = 0
@@ -166,6 +249,11 @@ def create_bot(settings: BotSettings, stats_manager: StatsManager) -> commands.B
         if message.channel.id != settings.wordle_channel_id:
             return
 
+        # Attachment- or embed-only messages carry no parseable text; skip
+        # the parse pipeline without touching the attachments themselves.
+        if not message.content:
+            return
+
         handled_summary, _, _ = await process_daily_summary(message)
         if handled_summary:
             return
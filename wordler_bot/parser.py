@@ -6,12 +6,16 @@ WORDLE_REGEX = re.compile(
     r"^Wordle\s+(?P<puzzle>\d+)\s+(?P<score>[0-6Xx])/6(?P<hard>\*?)",
     re.MULTILINE,
 )
-SUMMARY_LINE_REGEX = re.compile(r"(?P<score>[0-6Xx])/6:\s*(?P<body>.+)")
-MENTION_REGEX = re.compile(r"<@!?(?P<id>\d+)>")
-PLAIN_HANDLE_REGEX = re.compile(r"@(?P<handle>[A-Za-z0-9_.-]+)")
+# One alternation covering every token a daily summary can contain, so the
+# whole message is scanned in a single finditer pass instead of three regex
+# passes per line. The newline token closes the current score bucket, which
+# preserves the old per-line attribution.
+SUMMARY_TOKEN_REGEX = re.compile(
+    r"(?P<score>[0-6Xx])/6:|<@!?(?P<mention>\d+)>|@(?P<handle>[A-Za-z0-9_.-]+)|(?P<eol>\n)"
+)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WordleResult:
     """Structured representation of a single Wordle share message."""
 
@@ -22,7 +26,7 @@ class WordleResult:
     board: List[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailySummaryEntry:
     """Represents a parsed entry from the Wordle group summary message."""
 
@@ -38,6 +42,11 @@ def parse_wordle_message(content: str) -> Optional[WordleResult]:
     if not content:
         return None
 
+    # Cheap C-level substring check; the vast majority of channel traffic is
+    # not a Wordle share and should never reach the regex engine.
+    if "Wordle" not in content:
+        return None
+
     match = WORDLE_REGEX.search(content)
     if not match:
         return None
@@ -49,11 +58,14 @@ def parse_wordle_message(content: str) -> Optional[WordleResult]:
     attempts = int(score_raw) if success else None
 
     board_lines: List[str] = []
-    for line in content.splitlines()[1:]:
-        striped = line.strip()
-        if not striped:
-            continue
-        board_lines.append(line.rstrip())
+    # Many shares carry no board at all; find the first newline instead of
+    # materializing the full line list just to slice off the header.
+    newline_index = content.find("\n", match.end())
+    if newline_index != -1:
+        for line in content[newline_index + 1 :].splitlines():
+            if not line.strip():
+                continue
+            board_lines.append(line.rstrip())
 
     return WordleResult(
         puzzle_number=puzzle_number,
@@ -76,39 +88,41 @@ def parse_daily_summary(content: str) -> List[DailySummaryEntry]:
     if not content:
         return []
 
+    # Same prefilter idea as parse_wordle_message: no score token, no summary.
+    if "/6:" not in content:
+        return []
+
     entries: List[DailySummaryEntry] = []
     seen: set[str] = set()
-    for line in content.splitlines():
-        match = SUMMARY_LINE_REGEX.search(line)
-        if not match:
+    success: Optional[bool] = None
+    attempts: Optional[int] = None
+    for match in SUMMARY_TOKEN_REGEX.finditer(content):
+        score = match.group("score")
+        if score is not None:
+            score = score.upper()
+            success = score != "X"
+            attempts = int(score) if success else None
             continue
-        score = match.group("score").upper()
-        body = match.group("body").strip()
-        mention_ids = MENTION_REGEX.findall(body)
-        success = score != "X"
-        attempts = int(score) if success else None
-        added = False
-        for raw_id in mention_ids:
-            user_id = int(raw_id)
+        if match.group("eol") is not None:
+            success = None
+            attempts = None
+            continue
+        if success is None:
+            # Mention or handle before any score bucket on this line.
+            continue
+        mention = match.group("mention")
+        if mention is not None:
+            user_id = int(mention)
             key = f"id:{user_id}"
             if key in seen:
                 continue
             seen.add(key)
             entries.append(DailySummaryEntry(user_id=user_id, handle=None, success=success, attempts=attempts))
-            added = True
-
-        stripped_body = MENTION_REGEX.sub(" ", body)
-        for match_handle in PLAIN_HANDLE_REGEX.finditer(stripped_body):
-            handle = match_handle.group("handle").strip()
-            if not handle:
-                continue
+        else:
+            handle = match.group("handle")
             key = f"handle:{handle.lower()}"
             if key in seen:
                 continue
             seen.add(key)
             entries.append(DailySummaryEntry(user_id=None, handle=handle, success=success, attempts=attempts))
-            added = True
-
-        if not added:
-            continue
     return entries
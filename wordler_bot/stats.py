@@ -1,17 +1,39 @@
 import asyncio
-import json
 import logging
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import IO, Dict, List, Optional
+
+import orjson
 
 from .parser import WordleResult
 
 logger = logging.getLogger(__name__)
 
+# How many recorded results may accumulate in the write-ahead log before the
+# full JSON snapshot is rewritten, and the maximum age of a snapshot in seconds.
+WAL_FLUSH_RECORDS = 50
+WAL_FLUSH_SECONDS = 60.0
+
+# Legacy snapshots stored the six guess buckets under string keys; new data
+# uses a fixed six-slot list (index 0 = solved in one guess).
+_DIST_KEYS = ("1", "2", "3", "4", "5", "6")
+
+
+def _coerce_distribution(value) -> List[int]:
+    """Upcast legacy string-keyed distributions to the six-slot list."""
+    if isinstance(value, list):
+        buckets = [int(item) for item in value[:6]]
+        buckets.extend([0] * (6 - len(buckets)))
+        return buckets
+    if isinstance(value, dict):
+        return [int(value.get(key, 0)) for key in _DIST_KEYS]
+    return [0] * 6
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserSummary:
     user_id: str
     display_name: str
@@ -20,20 +42,61 @@ class UserSummary:
     losses: int
     win_rate: float
     average_attempts: Optional[float]
-    guess_distribution: Dict[str, int]
+    guess_distribution: List[int]
     total_attempts: int
     last_puzzle: Optional[int]
 
 
+@dataclass(slots=True)
+class PlayerRecord:
+    """Mutable per-player stats, kept as attributes instead of dict keys so
+    the leaderboard inner loop does offset loads rather than string hashes."""
+
+    display_name: str = "Unknown Player"
+    # Cached so leaderboard sorting and handle matching never re-lower names.
+    display_name_lower: str = ""
+    games_played: int = 0
+    wins: int = 0
+    losses: int = 0
+    total_attempts: int = 0
+    guess_distribution: List[int] = field(default_factory=lambda: [0] * 6)
+    last_puzzle: Optional[int] = None
+    last_result: Optional[Dict] = None
+
+    def __post_init__(self) -> None:
+        if not self.display_name_lower:
+            self.display_name_lower = self.display_name.lower()
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PlayerRecord":
+        return cls(
+            display_name=data.get("display_name", "Unknown Player"),
+            display_name_lower=data.get("display_name_lower", ""),
+            games_played=data.get("games_played", 0),
+            wins=data.get("wins", 0),
+            losses=data.get("losses", 0),
+            total_attempts=data.get("total_attempts", 0),
+            guess_distribution=_coerce_distribution(data.get("guess_distribution")),
+            last_puzzle=data.get("last_puzzle"),
+            last_result=data.get("last_result"),
+        )
+
+
 class StatsManager:
     """In-memory statistics store persisted to disk."""
 
     def __init__(self, data_path: Path):
         self.data_path = data_path
-        self._stats: Dict[str, Dict] = {}
+        self.wal_path = data_path.with_suffix(".wal")
+        self._stats: Dict[str, PlayerRecord] = {}
         self._processed_messages: set[str] = set()
+        self._processed_order: List[str] = []
         self._leaderboard_snapshot: List[str] = []
         self._lock = asyncio.Lock()
+        self._wal: IO[bytes] | None = None
+        self._dirty_count = 0
+        self._last_snapshot = time.monotonic()
+        self._leaderboard_cache: List[str] | None = None
 
     def load(self) -> None:
         """Load stats from disk."""
@@ -42,38 +105,75 @@ class StatsManager:
             logger.info("No stats file found at %s, starting fresh", self.data_path)
             self._stats = {}
             self._processed_messages = set()
+            self._replay_wal()
             return
 
         try:
-            with self.data_path.open("r", encoding="utf-8") as handle:
-                payload = json.load(handle)
-                if not isinstance(payload, dict):
-                    logger.warning("Stats file %s malformed, resetting", self.data_path)
-                    self._stats = {}
-                    self._processed_messages = set()
-                    return
-                users = payload.get("users")
-                if isinstance(users, dict):
-                    self._stats = users
-                    logger.info("Loaded %s Wordle players from %s", len(users), self.data_path)
-                else:
-                    logger.warning("Stats file %s missing 'users' object, resetting", self.data_path)
-                    self._stats = {}
-                processed = payload.get("processed_messages")
-                if isinstance(processed, list):
-                    self._processed_messages = {str(item) for item in processed}
-                else:
-                    self._processed_messages = set()
-                snapshot = payload.get("leaderboard_snapshot")
-                if isinstance(snapshot, list):
-                    self._leaderboard_snapshot = [str(item) for item in snapshot]
-                else:
-                    self._leaderboard_snapshot = []
-        except json.JSONDecodeError:
+            payload = orjson.loads(self.data_path.read_bytes())
+            if not isinstance(payload, dict):
+                logger.warning("Stats file %s malformed, resetting", self.data_path)
+                self._stats = {}
+                self._processed_messages = set()
+                return
+            users = payload.get("users")
+            if isinstance(users, dict):
+                self._stats = {
+                    str(user_id): PlayerRecord.from_dict(stats)
+                    for user_id, stats in users.items()
+                    if isinstance(stats, dict)
+                }
+                logger.info("Loaded %s Wordle players from %s", len(self._stats), self.data_path)
+            else:
+                logger.warning("Stats file %s missing 'users' object, resetting", self.data_path)
+                self._stats = {}
+            processed = payload.get("processed_messages")
+            if isinstance(processed, list):
+                self._processed_order = [str(item) for item in processed]
+                self._processed_messages = set(self._processed_order)
+            else:
+                self._processed_messages = set()
+                self._processed_order = []
+            snapshot = payload.get("leaderboard_snapshot")
+            if isinstance(snapshot, list):
+                self._leaderboard_snapshot = [str(item) for item in snapshot]
+            else:
+                self._leaderboard_snapshot = []
+        except orjson.JSONDecodeError:
             logger.exception("Failed to parse stats file %s, resetting store", self.data_path)
             self._stats = {}
             self._processed_messages = set()
             self._leaderboard_snapshot = []
+        self._replay_wal()
+
+    def _replay_wal(self) -> None:
+        """Re-apply records logged since the last full snapshot."""
+        if not self.wal_path.exists():
+            return
+        replayed = 0
+        with self.wal_path.open("rb") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    logger.warning("Dropping truncated WAL line in %s", self.wal_path)
+                    break
+                uid = record.get("uid")
+                stats = record.get("stats")
+                if not isinstance(uid, str) or not isinstance(stats, dict):
+                    continue
+                self._stats[uid] = PlayerRecord.from_dict(stats)
+                key = record.get("key")
+                if key:
+                    self._mark_processed(str(key))
+                replayed += 1
+        if replayed:
+            logger.info("Replayed %s records from WAL %s", replayed, self.wal_path)
+            # Consolidate the replayed records into a fresh snapshot so the
+            # WAL does not grow across restarts.
+            self._persist_locked()
 
     async def record_result(
         self,
@@ -91,22 +191,25 @@ class StatsManager:
             if key and key in self._processed_messages:
                 logger.debug("Skipping already recorded entry %s", key)
                 return False
-            stats = self._stats.setdefault(str(user.id), self._blank_stats(user.display_name))
-            stats["display_name"] = user.display_name
+            user_key = str(user.id)
+            stats = self._stats.get(user_key)
+            if stats is None:
+                stats = PlayerRecord(display_name=user.display_name)
+                self._stats[user_key] = stats
+            stats.display_name = user.display_name
+            stats.display_name_lower = user.display_name.lower()
 
             if result.success:
-                stats["wins"] += 1
-                stats["total_attempts"] += result.attempts or 0
-                bucket = str(result.attempts or 0)
-                if bucket not in stats["guess_distribution"]:
-                    stats["guess_distribution"][bucket] = 0
-                stats["guess_distribution"][bucket] += 1
+                stats.wins += 1
+                stats.total_attempts += result.attempts or 0
+                if result.attempts and 1 <= result.attempts <= 6:
+                    stats.guess_distribution[result.attempts - 1] += 1
             else:
-                stats["losses"] += 1
+                stats.losses += 1
 
-            stats["games_played"] = stats["wins"] + stats["losses"]
-            stats["last_puzzle"] = result.puzzle_number
-            stats["last_result"] = {
+            stats.games_played = stats.wins + stats.losses
+            stats.last_puzzle = result.puzzle_number
+            stats.last_result = {
                 "puzzle_number": result.puzzle_number,
                 "success": result.success,
                 "attempts": result.attempts,
@@ -123,34 +226,68 @@ class StatsManager:
             )
 
             if key:
-                self._processed_messages.add(key)
+                self._mark_processed(key)
 
-            self._persist_locked()
+            self._leaderboard_cache = None
+            self._append_wal_locked(user_key, stats, key)
+            self._dirty_count += 1
+            if (
+                self._dirty_count >= WAL_FLUSH_RECORDS
+                or time.monotonic() - self._last_snapshot >= WAL_FLUSH_SECONDS
+            ):
+                await self._persist_off_loop_locked()
             return True
 
     def get_user_summary(self, user_id: int) -> Optional[UserSummary]:
         stats = self._stats.get(str(user_id))
-        if not stats:
+        if stats is None:
             return None
         return self._make_summary(str(user_id), stats)
 
     def leaderboard(self, limit: int = 10) -> List[UserSummary]:
-        entries: List[UserSummary] = []
+        # Leaderboards are requested far more often than stats mutate, so the
+        # sorted ranking is cached and invalidated by record_result. Only the
+        # top `limit` UserSummary objects are ever materialized.
+        order = self._leaderboard_cache
+        if order is None:
+            order = self._rank_users()
+            self._leaderboard_cache = order
+        return [self._make_summary(user_id, self._stats[user_id]) for user_id in order[:limit]]
+
+    def _rank_users(self) -> List[str]:
+        """Return all user IDs with at least one game, best ranked first.
+
+        Rather than sorting UserSummary objects by a 4-tuple, the ranking
+        criteria (average attempts asc, wins desc, win rate desc) are packed
+        into one integer per user so each comparison is a single int compare;
+        display name breaks exact ties.
+        """
+        user_ids: List[str] = []
+        keys: List[int] = []
+        names_lower: List[str] = []
+        # Bound methods hoisted out of the loop; with slotted records the body
+        # is then pure offset loads and int arithmetic.
+        append_id = user_ids.append
+        append_key = keys.append
+        append_name = names_lower.append
         for user_id, stats in self._stats.items():
-            summary = self._make_summary(user_id, stats)
-            if summary.games_played == 0:
+            wins = stats.wins
+            games_played = stats.games_played
+            if not games_played:
                 continue
-            entries.append(summary)
-
-        entries.sort(
-            key=lambda item: (
-                item.average_attempts if item.average_attempts is not None else 99,
-                -item.wins,
-                -item.win_rate,
-                item.display_name.lower(),
-            )
-        )
-        return entries[:limit]
+            if wins:
+                # Milliattempt precision; clamp so garbage data cannot
+                # overflow into the wins bits.
+                avg_milli = min(round(stats.total_attempts * 1000 / wins), 99_000)
+            else:
+                avg_milli = 99_000  # matches the old "no average sorts last" sentinel
+            inv_wins = 0xFFFFF - min(wins, 0xFFFFF)
+            inv_rate = 1_000_000 - round(wins * 1_000_000 / games_played)
+            append_key((avg_milli << 41) | (inv_wins << 21) | inv_rate)
+            append_id(user_id)
+            append_name(stats.display_name_lower)
+        order = sorted(range(len(user_ids)), key=lambda index: (keys[index], names_lower[index]))
+        return [user_ids[index] for index in order]
 
     def get_leaderboard_snapshot(self) -> List[str]:
         return list(self._leaderboard_snapshot)
@@ -158,51 +295,87 @@ class StatsManager:
     async def update_leaderboard_snapshot(self, user_ids: List[str]) -> None:
         async with self._lock:
             self._leaderboard_snapshot = list(user_ids)
-            self._persist_locked()
+            await self._persist_off_loop_locked()
 
-    def _make_summary(self, user_id: str, stats: Dict) -> UserSummary:
-        games_played = stats.get("games_played", 0)
-        wins = stats.get("wins", 0)
-        losses = stats.get("losses", 0)
-        total_attempts = stats.get("total_attempts", 0)
+    def _make_summary(self, user_id: str, stats: PlayerRecord) -> UserSummary:
+        games_played = stats.games_played
+        wins = stats.wins
+        total_attempts = stats.total_attempts
         win_rate = (wins / games_played) if games_played else 0.0
         average_attempts = (total_attempts / wins) if wins else None
-        distribution = stats.get("guess_distribution") or {}
-        strings = {str(i): distribution.get(str(i), 0) for i in range(1, 7)}
         return UserSummary(
             user_id=user_id,
-            display_name=stats.get("display_name", "Unknown Player"),
+            display_name=stats.display_name,
             games_played=games_played,
             wins=wins,
-            losses=losses,
+            losses=stats.losses,
             win_rate=win_rate,
             average_attempts=average_attempts,
-            guess_distribution=strings,
+            guess_distribution=list(stats.guess_distribution),
             total_attempts=total_attempts,
-            last_puzzle=stats.get("last_puzzle"),
+            last_puzzle=stats.last_puzzle,
         )
 
-    def _persist_locked(self) -> None:
+    def _mark_processed(self, key: str) -> None:
+        """Track a processed message, keeping insertion order for persistence.
+
+        The set handles membership; the parallel list is what gets serialized,
+        so persisting never has to sort the whole collection.
+        """
+        if key not in self._processed_messages:
+            self._processed_messages.add(key)
+            self._processed_order.append(key)
+
+    def _append_wal_locked(self, user_id: str, stats: PlayerRecord, key: Optional[str]) -> None:
+        """Append the updated record to the write-ahead log.
+
+        Logging just the changed record keeps the per-result disk cost O(1)
+        instead of rewriting the full snapshot; replay on startup makes the
+        log idempotent.
+        """
+        if self._wal is None:
+            self.data_path.parent.mkdir(parents=True, exist_ok=True)
+            self._wal = self.wal_path.open("ab")
+        self._wal.write(orjson.dumps({"uid": user_id, "stats": stats, "key": key}) + b"\n")
+        self._wal.flush()
+
+    def _serialize_locked(self) -> bytes:
         payload = {
             "users": self._stats,
-            "processed_messages": sorted(self._processed_messages),
+            "processed_messages": self._processed_order,
             "leaderboard_snapshot": self._leaderboard_snapshot,
             "updated_at": datetime.now(tz=timezone.utc).isoformat(),
         }
+        # orjson is several times faster than stdlib json here and the
+        # snapshot is machine-read only, so no pretty-printing.
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+
+    def _write_snapshot(self, data: bytes) -> None:
+        self.data_path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = self.data_path.with_suffix(".tmp")
-        with tmp_path.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2)
+        tmp_path.write_bytes(data)
         tmp_path.replace(self.data_path)
 
-    @staticmethod
-    def _blank_stats(display_name: str) -> Dict:
-        return {
-            "display_name": display_name,
-            "games_played": 0,
-            "wins": 0,
-            "losses": 0,
-            "total_attempts": 0,
-            "guess_distribution": {str(i): 0 for i in range(1, 7)},
-            "last_puzzle": None,
-            "last_result": None,
-        }
+    def _finish_snapshot_locked(self) -> None:
+        if self._wal is not None:
+            self._wal.truncate(0)
+        elif self.wal_path.exists():
+            self.wal_path.unlink()
+        self._dirty_count = 0
+        self._last_snapshot = time.monotonic()
+
+    def _persist_locked(self) -> None:
+        self._write_snapshot(self._serialize_locked())
+        self._finish_snapshot_locked()
+
+    async def _persist_off_loop_locked(self) -> None:
+        """Write the snapshot without blocking the event loop.
+
+        Serialization stays under the lock; the file write runs in a worker
+        thread so message handlers and gateway heartbeats keep progressing
+        during persist spikes. The lock also keeps the WAL quiet until it is
+        truncated after the write lands.
+        """
+        data = self._serialize_locked()
+        await asyncio.to_thread(self._write_snapshot, data)
+        self._finish_snapshot_locked()